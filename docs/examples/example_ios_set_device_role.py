@@ -15,6 +15,14 @@ limitations under the License.
 from netbox_onboarding.netbox_keeper import NetboxKeeper
 from netbox_onboarding.onboarding.onboarding import Onboarding
 
+# Hostname substrings mapped to a device role, in order of precedence
+DEVICE_ROLE_KEYWORDS = (
+    ("router", ("rtr", "router")),
+    ("switch", ("sw", "switch")),
+    ("firewall", ("fw", "firewall")),
+    ("datacenter", ("dc",)),
+)
+
 
 class MyOnboardingClass(Onboarding):
     """Custom onboarding class example.
@@ -24,7 +32,7 @@ class MyOnboardingClass(Onboarding):
     onboarding parameters before the objects are created in NetBox.
 
     This class adds the get_device_role method that does the static
-     string comparison and returns the device role.
+     string comparison (see DEVICE_ROLE_KEYWORDS) and returns the device role.
     """
 
     def run(self, onboarding_kwargs):
@@ -47,18 +55,11 @@ class MyOnboardingClass(Onboarding):
         This is a static analysis of hostname string content only
         """
         hostname_lower = hostname.lower()
-        if ("rtr" in hostname_lower) or ("router" in hostname_lower):
-            role = "router"
-        elif ("sw" in hostname_lower) or ("switch" in hostname_lower):
-            role = "switch"
-        elif ("fw" in hostname_lower) or ("firewall" in hostname_lower):
-            role = "firewall"
-        elif "dc" in hostname_lower:
-            role = "datacenter"
-        else:
-            role = "generic"
-
-        return role
+        for role, keywords in DEVICE_ROLE_KEYWORDS:
+            if any(keyword in hostname_lower for keyword in keywords):
+                return role
+
+        return "generic"
 
 
 class OnboardingDriverExtensions:
@@ -34,3 +34,4 @@ class OnboardingTaskAdmin(admin.ModelAdmin):
         "timeout",
         "created",
     )
+    list_select_related = ("created_device", "site", "role", "platform")
@@ -13,21 +13,88 @@ limitations under the License.
 """
 
 from rest_framework import serializers
-from django_rq import get_queue
+from django.db import transaction
 
 from dcim.models import Site, DeviceRole, Platform
 
+from netbox_onboarding.helpers import enqueue_onboard_device_on_commit, get_default_queue
 from netbox_onboarding.models import OnboardingTask
 from netbox_onboarding.utils.credentials import Credentials
 
 
+def pop_credentials(validated_data):
+    """Remove the write-only credential fields from validated_data and return them as Credentials."""
+    # Fields are string-type so default to empty (instead of None)
+    return Credentials(
+        username=validated_data.pop("username", ""),
+        password=validated_data.pop("password", ""),
+        secret=validated_data.pop("secret", ""),
+    )
+
+
+class PrefetchedSlugRelatedField(serializers.SlugRelatedField):
+    """SlugRelatedField using the objects prefetched by OnboardingTaskListSerializer when available."""
+
+    def to_internal_value(self, data):
+        """Return the prefetched object for this slug, or look it up."""
+        prefetched = getattr(self.root, "prefetched", {}).get(self.field_name, {})
+
+        if isinstance(data, str) and data in prefetched:
+            return prefetched[data]
+
+        return super().to_internal_value(data)
+
+
+class OnboardingTaskListSerializer(serializers.ListSerializer):
+    """Serializer for creating multiple OnboardingTasks in a single request."""
+
+    prefetched_fields = ("site", "role", "platform")
+
+    def __init__(self, *args, **kwargs):
+        """Create the serializer, with no object prefetched yet."""
+        super().__init__(*args, **kwargs)
+        self.prefetched = {}
+
+    def to_internal_value(self, data):
+        """Resolve the slugs referenced by all submitted tasks with a single query per model."""
+        self.prefetched = {}
+
+        if isinstance(data, list):
+            for field_name in self.prefetched_fields:
+                field = self.child.fields[field_name]
+                slugs = {
+                    item[field_name]
+                    for item in data
+                    if isinstance(item, dict) and isinstance(item.get(field_name), str)
+                }
+                self.prefetched[field_name] = field.get_queryset().in_bulk(slugs, field_name=field.slug_field)
+
+        return super().to_internal_value(data)
+
+    def create(self, validated_data):
+        """Create the OnboardingTasks and enqueue them for processing with a single Redis round trip."""
+        pending = []
+        tasks = []
+
+        with transaction.atomic():
+            for attrs in validated_data:
+                credentials = pop_credentials(attrs)
+                ot = OnboardingTask.objects.create(**attrs)
+                tasks.append(ot)
+                pending.append((ot.id, credentials))
+
+            enqueue_onboard_device_on_commit(pending)
+
+        return tasks
+
+
 class OnboardingTaskSerializer(serializers.ModelSerializer):
     """Serializer for the OnboardingTask model."""
 
-    site = serializers.SlugRelatedField(
+    site = PrefetchedSlugRelatedField(
         many=False,
         read_only=False,
-        queryset=Site.objects.all(),
+        queryset=Site.objects.only("pk", "slug", "name"),
         slug_field="slug",
         required=True,
         help_text="NetBox site 'slug' value",
@@ -45,10 +112,10 @@ class OnboardingTaskSerializer(serializers.ModelSerializer):
 
     timeout = serializers.IntegerField(required=False, help_text="Timeout (sec) for device connect")
 
-    role = serializers.SlugRelatedField(
+    role = PrefetchedSlugRelatedField(
         many=False,
         read_only=False,
-        queryset=DeviceRole.objects.all(),
+        queryset=DeviceRole.objects.only("pk", "slug"),
         slug_field="slug",
         required=False,
         help_text="NetBox device role 'slug' value",
@@ -56,10 +123,10 @@ class OnboardingTaskSerializer(serializers.ModelSerializer):
 
     device_type = serializers.CharField(required=False, help_text="NetBox device type 'slug' value",)
 
-    platform = serializers.SlugRelatedField(
+    platform = PrefetchedSlugRelatedField(
         many=False,
         read_only=False,
-        queryset=Platform.objects.all(),
+        queryset=Platform.objects.only("pk", "slug"),
         slug_field="slug",
         required=False,
         help_text="NetBox Platform 'slug' value",
@@ -75,6 +142,7 @@ class OnboardingTaskSerializer(serializers.ModelSerializer):
 
     class Meta:  # noqa: D106 "Missing docstring in public nested class"
         model = OnboardingTask
+        list_serializer_class = OnboardingTaskListSerializer
         fields = [
             "id",
             "site",
@@ -93,18 +161,20 @@ class OnboardingTaskSerializer(serializers.ModelSerializer):
             "message",
         ]
 
+    def validate_ip_address(self, value):  # pylint: disable=no-self-use
+        """Reject prefixes, only an IP address or a DNS name can be onboarded, as checked again by the worker."""
+        if "/" in value:
+            raise serializers.ValidationError(f"ERROR appears a prefix was entered: {value}")
+
+        return value
+
     def create(self, validated_data):
         """Create an OnboardingTask and enqueue it for processing."""
-        # Fields are string-type so default to empty (instead of None)
-        username = validated_data.pop("username", "")
-        password = validated_data.pop("password", "")
-        secret = validated_data.pop("secret", "")
-
-        credentials = Credentials(username=username, password=password, secret=secret,)
+        credentials = pop_credentials(validated_data)
 
         ot = OnboardingTask.objects.create(**validated_data)
 
-        webhook_queue = get_queue("default")
+        webhook_queue = get_default_queue()
 
         webhook_queue.enqueue("netbox_onboarding.worker.onboard_device", ot.id, credentials)
 
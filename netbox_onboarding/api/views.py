@@ -12,22 +12,10 @@ See the License for the specific language governing permissions and
 limitations under the License.
 """
 
-# from drf_yasg.openapi import Parameter, TYPE_STRING
-# from drf_yasg.utils import swagger_auto_schema
-
 from rest_framework import mixins, viewsets
 
-# from rest_framework.decorators import action
-# from rest_framework.response import Response
-
-# from utilities.api import IsAuthenticatedOrLoginNotRequired
-
-# from dcim.models import Device, Site, Platform, DeviceRole
-
 from netbox_onboarding.models import OnboardingTask
 from netbox_onboarding.filters import OnboardingTaskFilter
-
-# from netbox_onboarding.choices import OnboardingStatusChoices
 from .serializers import OnboardingTaskSerializer
 
 
@@ -40,9 +28,17 @@ class OnboardingTaskView(
 ):
     """Create, check status of, and delete onboarding tasks.
 
+    A list of tasks can be POSTed to create them in bulk.
     In-place updates (PUT, PATCH) of tasks are not permitted.
     """
 
-    queryset = OnboardingTask.objects.all()
+    queryset = OnboardingTask.objects.with_related()
     filterset_class = OnboardingTaskFilter
     serializer_class = OnboardingTaskSerializer
+
+    def get_serializer(self, *args, **kwargs):
+        """Return a list serializer when a list of tasks is submitted."""
+        if isinstance(kwargs.get("data"), list):
+            kwargs["many"] = True
+
+        return super().get_serializer(*args, **kwargs)
@@ -7,3 +7,18 @@ NETMIKO_TO_NAPALM_STATIC = {
     "juniper_junos": "junos",
     "cisco_xr": "iosxr",
 }
+
+
+def get_platform_to_napalm():
+    """Return the NAPALM driver defined on each NetBox Platform, keyed by Platform slug.
+
+    The Platform table is queried on use (never at import time), fetching only the slug and napalm_driver columns.
+    """
+    from dcim.models import Platform  # pylint: disable=import-outside-toplevel
+
+    return dict(Platform.objects.exclude(napalm_driver="").values_list("slug", "napalm_driver"))
+
+
+def get_netmiko_to_napalm():
+    """Return the Netmiko device type to NAPALM driver map, updated with the NAPALM drivers defined in NetBox."""
+    return {**NETMIKO_TO_NAPALM_STATIC, **get_platform_to_napalm()}
@@ -17,20 +17,26 @@ class OnboardException(Exception):
     """A failure occurred during the onboarding process.
 
     The exception includes a reason "slug" as defined below as well as a humanized message.
+    An unknown reason is reported as "fail-general".
     """
 
-    REASONS = (
-        "fail-config",  # config provided is not valid
-        "fail-connect",  # device is unreachable at IP:PORT
-        "fail-execute",  # unable to execute device/API command
-        "fail-login",  # bad username/password
-        "fail-dns",  # failed to get IP address from name resolution
-        "fail-general",  # other error
+    REASONS = frozenset(
+        {
+            "fail-config",  # config provided is not valid
+            "fail-connect",  # device is unreachable at IP:PORT
+            "fail-execute",  # unable to execute device/API command
+            "fail-login",  # bad username/password
+            "fail-dns",  # failed to get IP address from name resolution
+            "fail-general",  # other error
+        }
     )
 
-    def __init__(self, reason, message, **kwargs):
+    def __init__(self, reason, message):
         """Exception Init."""
-        super(OnboardException, self).__init__(kwargs)
+        if reason not in self.REASONS:
+            reason = "fail-general"
+
+        super(OnboardException, self).__init__(reason, message)
         self.reason = reason
         self.message = message
 
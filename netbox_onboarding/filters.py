@@ -13,10 +13,12 @@ limitations under the License.
 """
 
 import django_filters
-from django.db.models import Q
+from django.core.validators import EMPTY_VALUES
+from django.db.models import Q, QuerySet
 
-from dcim.models import Site, DeviceRole, Platform
+from dcim.models import Device, Site, DeviceRole, Platform
 
+from .helpers import is_ip_address
 from .release import NETBOX_RELEASE_CURRENT, NETBOX_RELEASE_211
 from .models import OnboardingTask
 
@@ -41,35 +43,72 @@ class OnboardingTaskFilter(FitersetMixin):
     q = django_filters.CharFilter(method="search", label="Search",)
 
     site = django_filters.ModelMultipleChoiceFilter(
-        field_name="site__slug", queryset=Site.objects.all(), to_field_name="slug", label="Site (slug)",
+        field_name="site__slug", queryset=Site.objects.only("pk", "slug"), to_field_name="slug", label="Site (slug)",
     )
 
-    site_id = django_filters.ModelMultipleChoiceFilter(queryset=Site.objects.all(), label="Site (ID)",)
+    site_id = django_filters.ModelMultipleChoiceFilter(queryset=Site.objects.only("pk", "slug"), label="Site (ID)",)
 
     platform = django_filters.ModelMultipleChoiceFilter(
-        field_name="platform__slug", queryset=Platform.objects.all(), to_field_name="slug", label="Platform (slug)",
+        field_name="platform__slug",
+        queryset=Platform.objects.only("pk", "slug"),
+        to_field_name="slug",
+        label="Platform (slug)",
     )
 
     role = django_filters.ModelMultipleChoiceFilter(
-        field_name="role__slug", queryset=DeviceRole.objects.all(), to_field_name="slug", label="Device Role (slug)",
+        field_name="role__slug",
+        queryset=DeviceRole.objects.only("pk", "slug"),
+        to_field_name="slug",
+        label="Device Role (slug)",
     )
 
     class Meta:  # noqa: D106 "Missing docstring in public nested class"
         model = OnboardingTask
         fields = ["id", "site", "site_id", "platform", "role", "status", "failed_reason"]
 
+    @property
+    def qs(self):
+        """Return the filtered queryset, or the base queryset as-is when no filter has a value.
+
+        The multiple choice filters clean an empty value to an empty queryset, which is not in EMPTY_VALUES.
+        """
+        if (
+            not hasattr(self, "_qs")
+            and self.is_valid()
+            and all(
+                value in EMPTY_VALUES or (isinstance(value, QuerySet) and not value)
+                for value in self.form.cleaned_data.values()
+            )
+        ):
+            self._qs = self.queryset.all()  # pylint: disable=attribute-defined-outside-init
+
+        return super().qs
+
     def search(self, queryset, name, value):  # pylint: disable=unused-argument, no-self-use
         """Perform the filtered search."""
-        if not value.strip():
+        value = value.strip()
+        if not value:
             return queryset
+
+        # A complete IP address can only match the task IP address, answered with an indexed lookup
+        if is_ip_address(value):
+            return queryset.filter(ip_address=value)
+
+        # Related names are matched in subqueries on their own (small) tables, so that the OR clause
+        # below is evaluated on the OnboardingTask table alone instead of on its joins
         qs_filter = (
-            Q(id__icontains=value)
-            | Q(ip_address__icontains=value)
-            | Q(site__name__icontains=value)
-            | Q(platform__name__icontains=value)
-            | Q(created_device__name__icontains=value)
+            Q(ip_address__icontains=value)
+            | Q(site_id__in=Site.objects.filter(name__icontains=value).values("pk"))
+            | Q(platform_id__in=Platform.objects.filter(name__icontains=value).values("pk"))
+            | Q(created_device_id__in=Device.objects.filter(name__icontains=value).values("pk"))
             | Q(status__icontains=value)
             | Q(failed_reason__icontains=value)
             | Q(message__icontains=value)
         )
+
+        # A number is matched exactly against the task ID (index seek) rather than casting every ID to text,
+        # larger values are not a valid ID and would overflow the integer column.
+        if value.isdecimal() and len(value) < 10:
+            qs_filter |= Q(id=int(value))
+
         return queryset.filter(qs_filter)
@@ -13,14 +13,13 @@ limitations under the License.
 """
 
 from django import forms
-from django.db import transaction
-from django_rq import get_queue
 
 from utilities.forms import BootstrapMixin, CSVModelForm
 from dcim.models import Site, Platform, DeviceRole, DeviceType
 
 from .models import OnboardingTask
 from .choices import OnboardingStatusChoices, OnboardingFailChoices
+from .helpers import enqueue_onboard_device_on_commit, get_default_queue
 from .utils.credentials import Credentials
 
 BLANK_CHOICE = (("", "---------"),)
@@ -82,7 +81,7 @@ class OnboardingTaskForm(BootstrapMixin, forms.ModelForm):
         model = super().save(commit=commit, **kwargs)
         if commit:
             credentials = Credentials(self.data.get("username"), self.data.get("password"), self.data.get("secret"))
-            get_queue("default").enqueue("netbox_onboarding.worker.onboard_device", model.pk, credentials)
+            get_default_queue().enqueue("netbox_onboarding.worker.onboard_device", model.pk, credentials)
         return model
 
 
@@ -158,12 +157,16 @@ class OnboardingTaskFeedCSVForm(CSVModelForm):
             "role",
         ]
 
+    # Set by the bulk import view to a list shared by all the rows, enqueued at once when the import is committed
+    onboarding_batch = None
+
     def save(self, commit=True, **kwargs):
         """Save the model, and add it and the associated credentials to the onboarding worker queue."""
         model = super().save(commit=commit, **kwargs)
         if commit:
             credentials = Credentials(self.data.get("username"), self.data.get("password"), self.data.get("secret"))
-            transaction.on_commit(
-                lambda: get_queue("default").enqueue("netbox_onboarding.worker.onboard_device", model.pk, credentials)
-            )
+            if self.onboarding_batch is None:
+                enqueue_onboard_device_on_commit([(model.pk, credentials)])
+            else:
+                self.onboarding_batch.append((model.pk, credentials))
         return model
@@ -12,14 +12,28 @@ See the License for the specific language governing permissions and
 limitations under the License.
 """
 
+import inspect
 import socket
+from functools import lru_cache
 
-import netaddr
-from netaddr.core import AddrFormatError
+from django.db import transaction
 
 from .exceptions import OnboardException
 
 
+@lru_cache(maxsize=8192)
+def is_ip_address(value):
+    """Return True if value is an IPv4 or IPv6 address literal (as opposed to a DNS name or a prefix)."""
+    for family in (socket.AF_INET, socket.AF_INET6):
+        try:
+            socket.inet_pton(family, value)
+            return True
+        except (OSError, ValueError):
+            pass
+
+    return False
+
+
 def onboarding_task_fqdn_to_ip(ot):
     """Method to assure OT has FQDN resolved to IP address and rewritten into OT.
 
@@ -35,18 +49,63 @@ def onboarding_task_fqdn_to_ip(ot):
       OnboardException("fail-dns"):
         When a Name lookup via DNS fails to resolve an IP address
     """
-    try:
-        # If successful, this is an IP address and can pass
-        netaddr.IPAddress(ot.ip_address)
+    # An IP address can pass, checked first with the C-level parser of the socket module
+    if is_ip_address(ot.ip_address):
+        return
+
     # Raise an Exception for Prefix values
-    except ValueError:
+    if "/" in ot.ip_address:
         raise OnboardException(reason="fail-general", message=f"ERROR appears a prefix was entered: {ot.ip_address}")
-    # An AddrFormatError exception means that there is not an IP address in the field, and should continue on
-    except AddrFormatError:
-        try:
-            # Perform DNS Lookup
-            ot.ip_address = socket.gethostbyname(ot.ip_address)
-            ot.save()
-        except socket.gaierror:
-            # DNS Lookup has failed, Raise an exception for unable to complete DNS lookup
-            raise OnboardException(reason="fail-dns", message=f"ERROR failed to complete DNS lookup: {ot.ip_address}")
+
+    try:
+        # Perform DNS Lookup
+        ot.ip_address = socket.gethostbyname(ot.ip_address)
+        # last_updated is auto_now, it has to be listed to still be refreshed
+        ot.save(update_fields=["ip_address", "last_updated"])
+    except socket.gaierror:
+        # DNS Lookup has failed, Raise an exception for unable to complete DNS lookup
+        raise OnboardException(reason="fail-dns", message=f"ERROR failed to complete DNS lookup: {ot.ip_address}")
+
+
+def get_default_queue():
+    """Return the RQ "default" queue, django_rq is only imported when a job is actually enqueued."""
+    from django_rq import get_queue  # pylint: disable=import-outside-toplevel
+
+    return get_queue("default")
+
+
+@lru_cache(maxsize=None)
+def _enqueue_call_takes_pipeline(queue_class):
+    """Whether queue_class.enqueue_call() accepts a Redis pipeline, older RQ releases (NetBox 2.8 to 2.10) do not."""
+    return "pipeline" in inspect.signature(queue_class.enqueue_call).parameters
+
+
+def enqueue_onboard_device_batch(pending):
+    """Enqueue an onboarding job for each (task id, credentials) pair, using a single Redis round trip if RQ allows it.
+
+    Args:
+      pending (list): (OnboardingTask id, Credentials) tuples
+    """
+    queue = get_default_queue()
+
+    if not _enqueue_call_takes_pipeline(type(queue)):
+        for task_id, credentials in pending:
+            queue.enqueue("netbox_onboarding.worker.onboard_device", task_id, credentials)
+        return
+
+    with queue.connection.pipeline() as pipe:
+        for task_id, credentials in pending:
+            queue.enqueue_call("netbox_onboarding.worker.onboard_device", args=(task_id, credentials), pipeline=pipe)
+        pipe.execute()
+
+
+def enqueue_onboard_device_on_commit(pending):
+    """Enqueue the onboarding jobs of pending together, once the current transaction is committed.
+
+    pending may still be extended until then, e.g. with one job per row of a CSV import. If the transaction
+    is rolled back, Django discards the callback and none of the jobs are enqueued.
+
+    Args:
+      pending (list): (OnboardingTask id, Credentials) tuples
+    """
+    transaction.on_commit(lambda: enqueue_onboard_device_batch(pending))
@@ -0,0 +1 @@
+"""Management module for netbox_onboarding plugin."""
@@ -0,0 +1 @@
+"""Management commands for netbox_onboarding plugin."""
@@ -0,0 +1,34 @@
+"""Management command to create the missing OnboardingDevice objects.
+
+(c) 2020 Network To Code
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+  http://www.apache.org/licenses/LICENSE-2.0
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+from django.core.management.base import BaseCommand
+
+from netbox_onboarding.models import OnboardingDevice
+
+
+class Command(BaseCommand):
+    """Create an OnboardingDevice for every Device which has none."""
+
+    help = "Create an OnboardingDevice for every Device which has none, e.g. Devices created with bulk_create()"
+
+    def add_arguments(self, parser):
+        """Add the command line arguments."""
+        parser.add_argument(
+            "--batch-size", type=int, default=1000, help="Number of OnboardingDevice created per INSERT",
+        )
+
+    def handle(self, *args, **options):
+        """Run the command."""
+        created = OnboardingDevice.objects.create_missing(batch_size=options["batch_size"])
+        self.stdout.write(f"Created {created} OnboardingDevice")
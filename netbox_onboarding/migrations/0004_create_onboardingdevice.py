@@ -1,3 +1,5 @@
+from itertools import islice
+
 from django.db import migrations
 
 
@@ -5,8 +7,15 @@ def create_missing_onboardingdevice(apps, schema_editor):
     Device = apps.get_model("dcim", "Device")
     OnboardingDevice = apps.get_model("netbox_onboarding", "OnboardingDevice")
 
-    for device in Device.objects.filter(onboardingdevice__isnull=True):
-        OnboardingDevice.objects.create(device=device)
+    missing = Device.objects.filter(onboardingdevice__isnull=True)
+    device_ids = missing.values_list("pk", flat=True).iterator(chunk_size=2000)
+
+    # bulk_create() materializes its input, feed it one batch at a time to keep memory bounded
+    while True:
+        batch = [OnboardingDevice(device_id=device_id) for device_id in islice(device_ids, 1000)]
+        if not batch:
+            break
+        OnboardingDevice.objects.bulk_create(batch, ignore_conflicts=True)
 
 
 class Migration(migrations.Migration):
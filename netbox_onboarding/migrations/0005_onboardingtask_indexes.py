@@ -0,0 +1,54 @@
+from django.db import migrations, models
+
+# Django renders "icontains" on PostgreSQL as UPPER("column"::text) LIKE UPPER(%s),
+# the trigram indexes are built on that exact expression so that the planner can use them.
+# pg_trgm may not be installable by the NetBox database user, in that case the indexes are skipped.
+CREATE_SEARCH_INDEXES = """
+DO $$
+BEGIN
+    CREATE EXTENSION IF NOT EXISTS pg_trgm;
+    CREATE INDEX IF NOT EXISTS netbox_onboarding_ot_ip_address_trgm
+        ON netbox_onboarding_onboardingtask USING gin (UPPER(ip_address::text) gin_trgm_ops);
+    CREATE INDEX IF NOT EXISTS netbox_onboarding_ot_message_trgm
+        ON netbox_onboarding_onboardingtask USING gin (UPPER(message::text) gin_trgm_ops);
+EXCEPTION
+    WHEN insufficient_privilege OR undefined_file OR undefined_object THEN
+        RAISE NOTICE 'pg_trgm is not available, OnboardingTask search indexes not created';
+END
+$$;
+"""
+
+DROP_SEARCH_INDEXES = """
+DROP INDEX IF EXISTS netbox_onboarding_ot_ip_address_trgm;
+DROP INDEX IF EXISTS netbox_onboarding_ot_message_trgm;
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("netbox_onboarding", "0004_create_onboardingdevice"),
+    ]
+
+    operations = [
+        migrations.RunSQL(CREATE_SEARCH_INDEXES, reverse_sql=DROP_SEARCH_INDEXES),
+        migrations.AddIndex(
+            model_name="onboardingtask", index=models.Index(fields=["created"], name="onboardingtask_created_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="onboardingtask",
+            index=models.Index(fields=["status", "failed_reason"], name="onboardingtask_status_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="onboardingtask",
+            index=models.Index(fields=["ip_address", "-last_updated"], name="onboardingtask_ip_latest_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="onboardingtask",
+            index=models.Index(
+                fields=["ip_address", "-last_updated"],
+                name="onboardingtask_succeeded_idx",
+                condition=models.Q(status="succeeded"),
+            ),
+        ),
+    ]
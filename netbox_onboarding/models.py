@@ -11,10 +11,13 @@ WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 See the License for the specific language governing permissions and
 limitations under the License.
 """
+from itertools import islice
+
 from django.db.models.signals import post_save
 from django.dispatch import receiver
 from django.db import models
 from django.urls import reverse
+from django.utils.functional import cached_property
 from dcim.models import Device
 from .choices import OnboardingStatusChoices, OnboardingFailChoices
 from .release import NETBOX_RELEASE_CURRENT, NETBOX_RELEASE_29, NETBOX_RELEASE_211
@@ -29,6 +32,29 @@ elif NETBOX_RELEASE_CURRENT < NETBOX_RELEASE_211:
 else:
     from netbox.models import ChangeLoggedModel  # pylint: disable=no-name-in-module, import-error
 
+# Support NetBox 2.8
+if NETBOX_RELEASE_CURRENT < NETBOX_RELEASE_29:
+    BaseQuerySet = models.QuerySet
+# Support NetBox 2.9+ object-based permissions
+else:
+    from utilities.querysets import RestrictedQuerySet  # pylint: disable=no-name-in-module, import-error
+
+    BaseQuerySet = RestrictedQuerySet
+
+
+class OnboardingTaskQuerySet(BaseQuerySet):
+    """QuerySet for OnboardingTask instances."""
+
+    def with_related(self):
+        """Join the related objects of each OnboardingTask, as rendered by tables and API serializers."""
+        return self.select_related("site", "platform", "role", "created_device")
+
+    def for_list(self):
+        """Load only the columns rendered by OnboardingTaskTable, and join its related objects."""
+        return self.select_related("site", "platform", "created_device").only(
+            "id", "created", "ip_address", "site", "platform", "created_device", "status", "failed_reason", "message"
+        )
+
 
 class OnboardingTask(ChangeLoggedModel):
     """The status of each onboarding Task is tracked in the OnboardingTask table."""
@@ -60,6 +86,20 @@ class OnboardingTask(ChangeLoggedModel):
         help_text="Timeout period in sec to wait while connecting to the device", default=30
     )
 
+    class Meta:  # noqa: D106 "Missing docstring in public nested class"
+        indexes = [
+            models.Index(fields=["created"], name="onboardingtask_created_idx"),
+            models.Index(fields=["status", "failed_reason"], name="onboardingtask_status_idx"),
+            # Latest task of a device, also serves the lookups on ip_address alone
+            models.Index(fields=["ip_address", "-last_updated"], name="onboardingtask_ip_latest_idx"),
+            # Latest successful task of a device, see OnboardingDevice.last_check_successful_date
+            models.Index(
+                fields=["ip_address", "-last_updated"],
+                name="onboardingtask_succeeded_idx",
+                condition=models.Q(status=OnboardingStatusChoices.STATUS_SUCCEEDED),
+            ),
+        ]
+
     def __str__(self):
         """String representation of an OnboardingTask."""
         return f"{self.site} : {self.ip_address}"
@@ -68,10 +108,58 @@ class OnboardingTask(ChangeLoggedModel):
         """Provide absolute URL to an OnboardingTask."""
         return reverse("plugins:netbox_onboarding:onboardingtask", kwargs={"pk": self.pk})
 
-    if NETBOX_RELEASE_CURRENT >= NETBOX_RELEASE_29:
-        from utilities.querysets import RestrictedQuerySet  # pylint: disable=no-name-in-module, import-outside-toplevel
+    objects = OnboardingTaskQuerySet.as_manager()
+
+
+class OnboardingDeviceQuerySet(models.QuerySet):
+    """QuerySet for OnboardingDevice instances."""
+
+    def with_latest_task(self):
+        """Annotate each OnboardingDevice with the details of the latest OnboardingTask of its device.
+
+        All details are retrieved by the same SQL statement and are then used by the OnboardingDevice properties,
+        instead of running one query per property and per device.
+        """
+        tasks = OnboardingTask.objects.filter(ip_address=models.OuterRef("primary_ip_host")).order_by("-last_updated")
+
+        return self.annotate(
+            primary_ip_host=models.Func(
+                models.F("device__primary_ip4__address"), function="HOST", output_field=models.CharField()
+            ),
+            latest_ot_id=models.Subquery(tasks.values("pk")[:1]),
+            latest_status=models.Subquery(tasks.values("status")[:1]),
+            latest_created=models.Subquery(tasks.values("created")[:1]),
+            latest_success_created=models.Subquery(
+                tasks.filter(status=OnboardingStatusChoices.STATUS_SUCCEEDED).values("created")[:1]
+            ),
+        )
+
+    def create_missing(self, batch_size=1000):
+        """Create the OnboardingDevice of every Device which has none, e.g. Devices created with bulk_create().
+
+        Returns:
+          int: number of OnboardingDevice created
+        """
+        device_ids = (
+            Device.objects.filter(onboardingdevice__isnull=True).values_list("pk", flat=True).iterator(chunk_size=2000)
+        )
+        # bulk_create() returns the skipped rows along with the inserted ones, count the table itself instead
+        count_before = self.count()
 
-        objects = RestrictedQuerySet.as_manager()
+        # bulk_create() materializes its input, feed it one batch at a time to keep memory bounded
+        while True:
+            batch = [self.model(device_id=device_id) for device_id in islice(device_ids, batch_size)]
+            if not batch:
+                return self.count() - count_before
+            self.bulk_create(batch, ignore_conflicts=True)
+
+
+class OnboardingDeviceManager(models.Manager.from_queryset(OnboardingDeviceQuerySet)):
+    """Manager for OnboardingDevice instances."""
+
+    def get_queryset(self):
+        """Join the device primary IPv4 address, dereferenced by every OnboardingDevice property."""
+        return super().get_queryset().select_related("device__primary_ip4")
 
 
 class OnboardingDevice(models.Model):
@@ -80,70 +168,73 @@ class OnboardingDevice(models.Model):
     device = models.OneToOneField(to="dcim.Device", on_delete=models.CASCADE)
     enabled = models.BooleanField(default=True, help_text="Whether (re)onboarding of this device is permitted")
 
+    objects = OnboardingDeviceManager()
+
+    @cached_property
+    def _ip_str(self):
+        """Primary IPv4 address of the device without prefix length, as stored in OnboardingTask.ip_address."""
+        if not self.device.primary_ip4:
+            return None
+
+        # str() gives the same text as format() with the default dialect, without the dialect lookup
+        return str(self.device.primary_ip4.address.ip)  # pylint: disable=no-member
+
+    @cached_property
+    def _latest_ot(self):
+        """Latest OnboardingTask of the device, retrieved once and shared by the properties below."""
+        if not self._ip_str:
+            return None
+
+        return OnboardingTask.objects.filter(ip_address=self._ip_str).order_by("-last_updated").first()
+
     @property
     def last_check_attempt_date(self):
         """Date of last onboarding attempt for a device."""
-        if self.device.primary_ip4:
-            try:
-                return (
-                    OnboardingTask.objects.filter(
-                        ip_address=self.device.primary_ip4.address.ip.format()  # pylint: disable=no-member
-                    )
-                    .latest("last_updated")
-                    .created
-                )
-            except OnboardingTask.DoesNotExist:
-                return "unknown"
-        else:
-            return "unknown"
+        if hasattr(self, "latest_created"):
+            return self.latest_created or "unknown"
+
+        return self._latest_ot.created if self._latest_ot else "unknown"
 
     @property
     def last_check_successful_date(self):
         """Date of last successful onboarding for a device."""
-        if self.device.primary_ip4:
-            try:
-                return (
-                    OnboardingTask.objects.filter(
-                        ip_address=self.device.primary_ip4.address.ip.format(),  # pylint: disable=no-member
-                        status=OnboardingStatusChoices.STATUS_SUCCEEDED,
-                    )
-                    .latest("last_updated")
-                    .created
-                )
-            except OnboardingTask.DoesNotExist:
-                return "unknown"
-        else:
-            return "unknown"
+        if hasattr(self, "latest_success_created"):
+            return self.latest_success_created or "unknown"
+
+        if self._ip_str:
+            created = (
+                OnboardingTask.objects.filter(ip_address=self._ip_str, status=OnboardingStatusChoices.STATUS_SUCCEEDED,)
+                .order_by("-last_updated")
+                .values_list("created", flat=True)
+                .first()
+            )
+            return created or "unknown"
+
+        return "unknown"
 
     @property
     def status(self):
         """Last onboarding status."""
-        if self.device.primary_ip4:
-            try:
-                return (
-                    OnboardingTask.objects.filter(
-                        ip_address=self.device.primary_ip4.address.ip.format()  # pylint: disable=no-member
-                    )
-                    .latest("last_updated")
-                    .status
-                )
-            except OnboardingTask.DoesNotExist:
-                return "unknown"
-        else:
-            return "unknown"
+        if hasattr(self, "latest_status"):
+            return self.latest_status or "unknown"
+
+        return self._latest_ot.status if self._latest_ot else "unknown"
 
     @property
     def last_ot(self):
         """Last onboarding task."""
-        if self.device.primary_ip4:
-            try:
-                return OnboardingTask.objects.filter(
-                    ip_address=self.device.primary_ip4.address.ip.format()  # pylint: disable=no-member
-                ).latest("last_updated")
-            except OnboardingTask.DoesNotExist:
-                return "unknown"
-        else:
-            return "unknown"
+        if hasattr(self, "latest_ot_id"):
+            return OnboardingTask.objects.get(pk=self.latest_ot_id) if self.latest_ot_id else "unknown"
+
+        return self._latest_ot or "unknown"
+
+    @property
+    def last_ot_id(self):
+        """ID of the last onboarding task, None if there is no task for the device."""
+        if hasattr(self, "latest_ot_id"):
+            return self.latest_ot_id
+
+        return self._latest_ot.pk if self._latest_ot else None
 
 
 @receiver(post_save, sender=Device)
@@ -151,6 +242,11 @@ def init_onboarding_for_new_device(sender, instance, created, **kwargs):  # pyli
     """Register to create a OnboardingDevice object for each new Device Object using Django Signal.
 
     https://docs.djangoproject.com/en/3.0/ref/signals/#post-save
+
+    The INSERT ignores an already existing OnboardingDevice, so that concurrent saves of the same Device
+    can't fail with an IntegrityError. When importing a large number of devices, this receiver can be
+    disconnected and the missing OnboardingDevice created afterwards in batches with
+    OnboardingDevice.objects.create_missing() (or the create_missing_onboardingdevices management command).
     """
     if created:
-        OnboardingDevice.objects.create(device=instance)
+        OnboardingDevice.objects.bulk_create([OnboardingDevice(device=instance)], ignore_conflicts=True)
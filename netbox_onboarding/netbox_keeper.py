@@ -16,19 +16,23 @@ import logging
 import re
 
 from django.conf import settings
+from django.db import transaction
+from django.db.models import Case, IntegerField, Q, Value, When
 from django.utils.text import slugify
 from dcim.models import Manufacturer, Device, Interface, DeviceType, DeviceRole
 from dcim.models import Platform
 from dcim.models import Site
 from ipam.models import IPAddress
 
-from .constants import NETMIKO_TO_NAPALM_STATIC
+from .constants import get_netmiko_to_napalm
 from .exceptions import OnboardException
 
 logger = logging.getLogger("rq.worker")
 
 PLUGIN_SETTINGS = settings.PLUGINS_CONFIG["netbox_onboarding"]
 
+NOT_SLUGGABLE_RE = re.compile(r"[^a-zA-Z0-9\-_]+")
+
 
 def object_match(obj, search_array):
     """Used to search models for multiple criteria.
@@ -42,30 +46,49 @@ def object_match(obj, search_array):
                             {"slug__iexact": 'switch1'},
                             {"model__iexact": 'Cisco'}
                         ]
+
+    All the criteria are evaluated by a single query, each object being ranked by the first criteria it matches.
+
+    Raises:
+        obj.DoesNotExist: when no object matches any criteria
+        obj.MultipleObjectsReturned: when several objects match the first criteria, as QuerySet.get() does
+        OnboardException('fail-general'): when several objects match the first matching loose criteria
     """
-    try:
-        result = obj.objects.get(**search_array[0])
-        return result
-    except obj.DoesNotExist:
-        if PLUGIN_SETTINGS["object_match_strategy"] == "loose":
-            for search_array_element in search_array[1:]:
-                try:
-                    result = obj.objects.get(**search_array_element)
-                    return result
-                except obj.DoesNotExist:
-                    pass
-                except obj.MultipleObjectsReturned:
-                    raise OnboardException(
-                        reason="fail-general",
-                        message=f"ERROR multiple objects found in {str(obj)} searching on {str(search_array_element)})",
-                    )
-        raise
-    except obj.MultipleObjectsReturned:
+    if PLUGIN_SETTINGS["object_match_strategy"] == "loose":
+        criteria = search_array
+    else:
+        criteria = search_array[:1]
+
+    query = Q()
+    ranks = []
+    for rank, search_array_element in enumerate(criteria):
+        query |= Q(**search_array_element)
+        ranks.append(When(Q(**search_array_element), then=Value(rank)))
+
+    # The 2 best ranked objects are enough to tell whether the first matching criteria matches a single object
+    results = list(
+        obj.objects.filter(query)
+        .annotate(object_match_rank=Case(*ranks, output_field=IntegerField()))
+        .order_by("object_match_rank")[:2]
+    )
+
+    if not results:
+        object_name = obj._meta.object_name  # pylint: disable=protected-access
+        raise obj.DoesNotExist(f"{object_name} matching query does not exist.")
+
+    if len(results) > 1 and results[0].object_match_rank == results[1].object_match_rank == 0:
+        object_name = obj._meta.object_name  # pylint: disable=protected-access
+        raise obj.MultipleObjectsReturned(f"get() returned more than one {object_name} searching on {criteria[0]}")
+
+    if len(results) > 1 and results[0].object_match_rank == results[1].object_match_rank:
         raise OnboardException(
             reason="fail-general",
-            message=f"ERROR multiple objects found in {str(obj)} searching on {str(search_array_element)})",
+            message=f"ERROR multiple objects found in {str(obj)} searching on "
+            f"{str(criteria[results[0].object_match_rank])})",
         )
 
+    return results[0]
+
 
 class NetboxKeeper:
     """Used to manage the information relating to the network device within the NetBox server."""
@@ -146,7 +169,10 @@ class NetboxKeeper:
         """
         try:
             if self.netdev_mgmt_ip_address:
-                self.onboarded_device = Device.objects.get(primary_ip4__address__net_host=self.netdev_mgmt_ip_address)
+                # device_type and its manufacturer are read when skipping their update for existing devices
+                self.onboarded_device = Device.objects.select_related("device_type__manufacturer").get(
+                    primary_ip4__address__net_host=self.netdev_mgmt_ip_address
+                )
         except Device.DoesNotExist:
             logger.info(
                 "Could not find existing NetBox device for requested primary IP address (%s)",
@@ -165,12 +191,19 @@ class NetboxKeeper:
         except Site.DoesNotExist:
             raise OnboardException(reason="fail-config", message=f"Site not found: {self.netdev_nb_site_slug}")
 
-    def ensure_device_manufacturer(
-        self,
-        create_manufacturer=PLUGIN_SETTINGS["create_manufacturer_if_missing"],
-        skip_manufacturer_on_update=PLUGIN_SETTINGS["skip_manufacturer_on_update"],
-    ):
-        """Ensure device's manufacturer."""
+    def ensure_device_manufacturer(self, create_manufacturer=None, skip_manufacturer_on_update=None):
+        """Ensure device's manufacturer.
+
+        Args:
+          create_manufacturer (bool): create the manufacturer if missing, defaults to the plugin setting
+          skip_manufacturer_on_update (bool): skip manufacturer updates for existing devices,
+            defaults to the plugin setting
+        """
+        if create_manufacturer is None:
+            create_manufacturer = PLUGIN_SETTINGS["create_manufacturer_if_missing"]
+        if skip_manufacturer_on_update is None:
+            skip_manufacturer_on_update = PLUGIN_SETTINGS["skip_manufacturer_on_update"]
+
         # Support to skip manufacturer updates for existing devices
         if self.onboarded_device and skip_manufacturer_on_update:
             self.nb_manufacturer = self.onboarded_device.device_type.manufacturer
@@ -183,22 +216,30 @@ class NetboxKeeper:
 
         nb_manufacturer_slug = slugify(self.netdev_vendor)
 
+        if create_manufacturer:
+            try:
+                # Lookup and creation of a missing manufacturer in one call, safe against concurrent workers
+                self.nb_manufacturer, created = Manufacturer.objects.get_or_create(
+                    slug__iexact=nb_manufacturer_slug,
+                    defaults={"name": self.netdev_vendor, "slug": nb_manufacturer_slug},
+                )
+            except Manufacturer.MultipleObjectsReturned:
+                raise OnboardException(
+                    reason="fail-general", message=f"ERROR multiple manufacturers found for slug {nb_manufacturer_slug}"
+                )
+
+            if created:
+                logger.info("CREATE: manufacturer: %s", self.netdev_vendor)
+
+            return
+
         try:
             search_array = [{"slug__iexact": nb_manufacturer_slug}]
             self.nb_manufacturer = object_match(Manufacturer, search_array)
         except Manufacturer.DoesNotExist:
-            if create_manufacturer:
-                self.nb_manufacturer = Manufacturer.objects.create(name=self.netdev_vendor, slug=nb_manufacturer_slug)
-            else:
-                raise OnboardException(
-                    reason="fail-config", message=f"ERROR manufacturer not found: {self.netdev_vendor}"
-                )
+            raise OnboardException(reason="fail-config", message=f"ERROR manufacturer not found: {self.netdev_vendor}")
 
-    def ensure_device_type(
-        self,
-        create_device_type=PLUGIN_SETTINGS["create_device_type_if_missing"],
-        skip_device_type_on_update=PLUGIN_SETTINGS["skip_device_type_on_update"],
-    ):
+    def ensure_device_type(self, create_device_type=None, skip_device_type_on_update=None):
         """Ensure the Device Type (slug) exists in NetBox associated to the netdev "model" and "vendor" (manufacturer).
 
         Args:
@@ -214,6 +255,11 @@ class NetboxKeeper:
             manufacturer.  This should *not* happen, but guard-rail checking
             regardless in case two vendors have the same model name.
         """
+        if create_device_type is None:
+            create_device_type = PLUGIN_SETTINGS["create_device_type_if_missing"]
+        if skip_device_type_on_update is None:
+            skip_device_type_on_update = PLUGIN_SETTINGS["skip_device_type_on_update"]
+
         # Support to skip device type updates for existing devices
         if self.onboarded_device and skip_device_type_on_update:
             self.nb_device_type = self.onboarded_device.device_type
@@ -225,7 +271,7 @@ class NetboxKeeper:
         # if it doesn't exist, create it if the flag 'create_device_type_if_missing' is defined
 
         slug = self.netdev_model
-        if self.netdev_model and re.search(r"[^a-zA-Z0-9\-_]+", slug):
+        if self.netdev_model and NOT_SLUGGABLE_RE.search(slug):
             logger.warning("device model is not sluggable: %s", slug)
             self.netdev_model = slug.replace(" ", "-")
             logger.warning("device model is now: %s", self.netdev_model)
@@ -247,7 +293,7 @@ class NetboxKeeper:
 
             self.nb_device_type = object_match(DeviceType, search_array)
 
-            if self.nb_device_type.manufacturer.id != self.nb_manufacturer.id:
+            if self.nb_device_type.manufacturer_id != self.nb_manufacturer.pk:
                 raise OnboardException(
                     reason="fail-config",
                     message=f"ERROR device type {self.netdev_model} " f"already exists for vendor {self.netdev_vendor}",
@@ -264,9 +310,7 @@ class NetboxKeeper:
                     reason="fail-config", message=f"ERROR device type not found: {self.netdev_model}"
                 )
 
-    def ensure_device_role(
-        self, create_device_role=PLUGIN_SETTINGS["create_device_role_if_missing"],
-    ):
+    def ensure_device_role(self, create_device_role=None):
         """Ensure that the device role is defined / exist in NetBox or create it if it doesn't exist.
 
         Args:
@@ -276,6 +320,9 @@ class NetboxKeeper:
             When the device role value does not exist
             NetBox.
         """
+        if create_device_role is None:
+            create_device_role = PLUGIN_SETTINGS["create_device_role_if_missing"]
+
         try:
             self.nb_device_role = DeviceRole.objects.get(slug=self.netdev_nb_role_slug)
         except DeviceRole.DoesNotExist:
@@ -291,7 +338,7 @@ class NetboxKeeper:
                     reason="fail-config", message=f"ERROR device role not found: {self.netdev_nb_role_slug}"
                 )
 
-    def ensure_device_platform(self, create_platform_if_missing=PLUGIN_SETTINGS["create_platform_if_missing"]):
+    def ensure_device_platform(self, create_platform_if_missing=None):
         """Get platform object from NetBox filtered by platform_slug.
 
         Args:
@@ -306,6 +353,9 @@ class NetboxKeeper:
 
         Lookup is performed based on the object's slug field (not the name field)
         """
+        if create_platform_if_missing is None:
+            create_platform_if_missing = PLUGIN_SETTINGS["create_platform_if_missing"]
+
         try:
             self.netdev_nb_platform_slug = (
                 self.netdev_nb_platform_slug
@@ -324,14 +374,8 @@ class NetboxKeeper:
 
         except Platform.DoesNotExist:
             if create_platform_if_missing:
-                platform_to_napalm_netbox = {
-                    platform.slug: platform.napalm_driver
-                    for platform in Platform.objects.all()
-                    if platform.napalm_driver
-                }
-
-                # Update Constants if Napalm driver is defined for NetBox Platform
-                netmiko_to_napalm = {**NETMIKO_TO_NAPALM_STATIC, **platform_to_napalm_netbox}
+                # Constants updated with the Napalm drivers defined for NetBox Platforms, shared through the cache
+                netmiko_to_napalm = get_netmiko_to_napalm()
 
                 self.nb_platform = Platform.objects.create(
                     name=self.netdev_nb_platform_slug,
@@ -343,12 +387,15 @@ class NetboxKeeper:
                     reason="fail-general", message=f"ERROR platform not found in NetBox: {self.netdev_nb_platform_slug}"
                 )
 
-    def ensure_device_instance(self, default_status=PLUGIN_SETTINGS["default_device_status"]):
+    def ensure_device_instance(self, default_status=None):
         """Ensure that the device instance exists in NetBox and is assigned the provided device role or DEFAULT_ROLE.
 
         Args:
           default_status (str) : status assigned to a new device by default.
         """
+        if default_status is None:
+            default_status = PLUGIN_SETTINGS["default_device_status"]
+
         if self.onboarded_device:
             # Construct lookup arguments if onboarded device already exists in NetBox
 
@@ -412,25 +459,30 @@ class NetboxKeeper:
                 address=f"{self.netdev_mgmt_ip_address}/{self.netdev_mgmt_pflen}"
             )
 
-            if created or not self.nb_primary_ip in self.nb_mgmt_ifname.ip_addresses.all():
+            if created or not self.nb_mgmt_ifname.ip_addresses.filter(pk=self.nb_primary_ip.pk).exists():
                 logger.info("ASSIGN: IP address %s to %s", self.nb_primary_ip.address, self.nb_mgmt_ifname.name)
                 self.nb_mgmt_ifname.ip_addresses.add(self.nb_primary_ip)
-                self.nb_mgmt_ifname.save()
 
-            # Ensure the primary IP is assigned to the device
-            self.device.primary_ip4 = self.nb_primary_ip
-            self.device.save()
+            # Ensure the primary IP is assigned to the device, a device found by its primary IP already has it
+            if self.device.primary_ip4_id != self.nb_primary_ip.pk:
+                self.device.primary_ip4 = self.nb_primary_ip
+                self.device.save()
 
     def ensure_device(self):
-        """Ensure that the device represented by the DevNetKeeper exists in the NetBox system."""
-        self.ensure_onboarded_device()
-        self.ensure_device_site()
-        self.ensure_device_manufacturer()
-        self.ensure_device_type()
-        self.ensure_device_role()
-        self.ensure_device_platform()
-        self.ensure_device_instance()
-
-        if PLUGIN_SETTINGS["create_management_interface_if_missing"]:
-            self.ensure_interface()
-            self.ensure_primary_ip()
+        """Ensure that the device represented by the DevNetKeeper exists in the NetBox system.
+
+        All the objects are looked up, created and updated in a single transaction: a single commit for the
+        whole device, and nothing left half-created when a step fails.
+        """
+        with transaction.atomic():
+            self.ensure_onboarded_device()
+            self.ensure_device_site()
+            self.ensure_device_manufacturer()
+            self.ensure_device_type()
+            self.ensure_device_role()
+            self.ensure_device_platform()
+            self.ensure_device_instance()
+
+            if PLUGIN_SETTINGS["create_management_interface_if_missing"]:
+                self.ensure_interface()
+                self.ensure_primary_ip()
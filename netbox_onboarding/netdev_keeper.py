@@ -15,7 +15,6 @@ limitations under the License.
 import importlib
 import logging
 import socket
-from dcim.models import Platform
 from django.conf import settings
 from napalm import get_network_driver
 from napalm.base.exceptions import ConnectionException, CommandErrorException
@@ -26,7 +25,7 @@ from netmiko.ssh_exception import NetMikoTimeoutException
 from paramiko.ssh_exception import SSHException
 
 from netbox_onboarding.onboarding.onboarding import StandaloneOnboarding
-from .constants import NETMIKO_TO_NAPALM_STATIC
+from .constants import get_netmiko_to_napalm
 from .exceptions import OnboardException
 
 logger = logging.getLogger("rq.worker")
@@ -193,14 +192,7 @@ class NetdevKeeper:
 
             self.netmiko_device_type = netmiko_device_type
 
-            platform_to_napalm_netbox = {
-                platform.slug: platform.napalm_driver for platform in Platform.objects.all() if platform.napalm_driver
-            }
-
-            # Update Constants if Napalm driver is defined for NetBox Platform
-            netmiko_to_napalm = {**NETMIKO_TO_NAPALM_STATIC, **platform_to_napalm_netbox}
-
-            self.napalm_driver = netmiko_to_napalm.get(netmiko_device_type)
+            self.napalm_driver = get_netmiko_to_napalm().get(netmiko_device_type)
 
     def check_napalm_driver_name(self):
         """Checks for napalm driver name."""
@@ -285,6 +277,10 @@ class NetdevKeeper:
                     self.napalm_driver,
                 )
 
+        except OnboardException:
+            # Already carries the precise failure reason (e.g. raised while guessing the device type)
+            raise
+
         except ConnectionException as exc:
             raise OnboardException(reason="fail-login", message=exc.args[0])
 
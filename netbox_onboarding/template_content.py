@@ -23,7 +23,7 @@ class DeviceContent(PluginTemplateExtension):  # pylint: disable=abstract-method
 
     def right_page(self):
         """Show table on right side of view."""
-        onboarding = OnboardingDevice.objects.filter(device=self.context["object"]).first()
+        onboarding = OnboardingDevice.objects.filter(device=self.context["object"]).with_latest_task().first()
 
         if not onboarding or not onboarding.enabled:
             return ""
@@ -31,7 +31,7 @@ class DeviceContent(PluginTemplateExtension):  # pylint: disable=abstract-method
         status = onboarding.status
         last_check_attempt_date = onboarding.last_check_attempt_date
         last_check_successful_date = onboarding.last_check_successful_date
-        last_ot = onboarding.last_ot
+        last_ot_id = onboarding.last_ot_id
 
         return self.render(
             "netbox_onboarding/device_onboarding_table.html",
@@ -39,7 +39,7 @@ class DeviceContent(PluginTemplateExtension):  # pylint: disable=abstract-method
                 "status": status,
                 "last_check_attempt_date": last_check_attempt_date,
                 "last_check_successful_date": last_check_successful_date,
-                "last_ot": last_ot,
+                "last_ot_id": last_ot_id,
             },
         )
 
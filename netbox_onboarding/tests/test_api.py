@@ -86,6 +86,35 @@ class OnboardingTaskTestCase(TestCase):
         self.assertEqual(onboarding_task.ip_address, data["ip_address"])
         self.assertEqual(onboarding_task.site, self.site1)
 
+    def test_create_task_prefix(self):
+        """Verify that an OnboardingTask cannot be created for a prefix."""
+        url = reverse(f"{self.base_url_lookup}-list")
+
+        for ip_address in ("10.10.10.0/24", "host/24"):
+            data = {"ip_address": ip_address, "site": self.site1.slug}
+
+            response = self.client.post(url, data, format="json")
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+            self.assertIn("ip_address", response.data)
+
+    def test_create_tasks_bulk(self):
+        """Verify that multiple OnboardingTasks can be created in a single request."""
+        url = reverse(f"{self.base_url_lookup}-list")
+        data = [
+            {"ip_address": "10.10.10.20", "site": self.site1.slug},
+            {"ip_address": "10.10.10.21", "site": self.site1.slug, "port": 830},
+        ]
+
+        response = self.client.post(url, data, format="json")
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(len(response.data), 2)
+
+        for item, created in zip(data, response.data):
+            onboarding_task = OnboardingTask.objects.get(pk=created["id"])
+            self.assertEqual(onboarding_task.ip_address, item["ip_address"])
+            self.assertEqual(onboarding_task.site, self.site1)
+            self.assertEqual(onboarding_task.port, item.get("port", 22))
+
     def test_update_task_forbidden(self):
         """Verify that an OnboardingTask cannot be updated via this API."""
         url = reverse(f"{self.base_url_lookup}-detail", kwargs={"pk": self.onboarding_task1.pk})
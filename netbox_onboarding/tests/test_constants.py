@@ -0,0 +1,44 @@
+"""Unit tests for the netbox_onboarding Platform to NAPALM driver map.
+
+(c) 2020 Network To Code
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+  http://www.apache.org/licenses/LICENSE-2.0
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+from django.test import TestCase
+
+from dcim.models import Platform
+
+from netbox_onboarding.constants import get_netmiko_to_napalm, get_platform_to_napalm
+
+
+class PlatformToNapalmTestCase(TestCase):
+    """Test the Platform to NAPALM driver map."""
+
+    def setUp(self):
+        """Create a Platform with a NAPALM driver, and one without."""
+        Platform.objects.create(name="Cisco IOS", slug="ios-custom", napalm_driver="ios")
+        Platform.objects.create(name="No driver", slug="no-driver")
+
+    def test_platform_to_napalm(self):
+        """Verify that only the Platforms with a NAPALM driver are listed."""
+        self.assertEqual(get_platform_to_napalm(), {"ios-custom": "ios"})
+
+    def test_platform_saved(self):
+        """Verify that a Platform saved afterwards is listed on next use."""
+        get_platform_to_napalm()
+        Platform.objects.create(name="Arista EOS", slug="eos-custom", napalm_driver="eos")
+
+        self.assertEqual(get_platform_to_napalm(), {"ios-custom": "ios", "eos-custom": "eos"})
+
+    def test_netmiko_to_napalm(self):
+        """Verify that the NAPALM drivers defined in NetBox are merged with the static map."""
+        netmiko_to_napalm = get_netmiko_to_napalm()
+        self.assertEqual(netmiko_to_napalm["cisco_ios"], "ios")
+        self.assertEqual(netmiko_to_napalm["ios-custom"], "ios")
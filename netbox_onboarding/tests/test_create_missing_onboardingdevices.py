@@ -0,0 +1,71 @@
+"""Unit tests for the create_missing_onboardingdevices management command.
+
+(c) 2020 Network To Code
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+  http://www.apache.org/licenses/LICENSE-2.0
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+from io import StringIO
+from unittest import mock
+
+from django.core.management import call_command
+from django.db import models
+from django.test import TestCase
+
+from dcim.models import Site, DeviceRole, DeviceType, Manufacturer, Device
+
+from netbox_onboarding.models import OnboardingDevice, OnboardingDeviceQuerySet
+
+
+class CreateMissingOnboardingDevicesTestCase(TestCase):
+    """Test the create_missing_onboardingdevices management command."""
+
+    def setUp(self):
+        """Create Devices without their OnboardingDevice, as if created with bulk_create()."""
+        site = Site.objects.create(name="USWEST", slug="uswest")
+        manufacturer = Manufacturer.objects.create(name="Juniper", slug="juniper")
+        device_role = DeviceRole.objects.create(name="Firewall", slug="firewall")
+        device_type = DeviceType.objects.create(slug="srx3600", model="SRX3600", manufacturer=manufacturer)
+
+        self.devices = [
+            Device.objects.create(device_type=device_type, name=f"device{index}", device_role=device_role, site=site)
+            for index in range(3)
+        ]
+
+        OnboardingDevice.objects.filter(device__in=self.devices[1:]).delete()
+
+    def call_command(self, *args):
+        """Run the command and return its output."""
+        stdout = StringIO()
+        call_command("create_missing_onboardingdevices", *args, stdout=stdout)
+        return stdout.getvalue()
+
+    def test_create_missing(self):
+        """Verify that an OnboardingDevice is created for every Device which has none."""
+        self.assertIn("Created 2 OnboardingDevice", self.call_command())
+        self.assertEqual(
+            set(OnboardingDevice.objects.values_list("device_id", flat=True)), {device.pk for device in self.devices}
+        )
+
+    def test_batch_size(self):
+        """Verify that the OnboardingDevices are inserted in batches of --batch-size."""
+        with mock.patch.object(
+            OnboardingDeviceQuerySet, "bulk_create", autospec=True, side_effect=models.QuerySet.bulk_create
+        ) as bulk_create:
+            self.call_command("--batch-size", "1")
+
+        self.assertEqual([len(call[0][1]) for call in bulk_create.call_args_list], [1, 1])
+        self.assertEqual(OnboardingDevice.objects.count(), 3)
+
+    def test_second_run_noop(self):
+        """Verify that running the command again creates nothing."""
+        self.call_command()
+
+        self.assertIn("Created 0 OnboardingDevice", self.call_command())
+        self.assertEqual(OnboardingDevice.objects.count(), 3)
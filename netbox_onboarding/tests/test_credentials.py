@@ -0,0 +1,58 @@
+"""Unit tests for netbox_onboarding Credentials.
+
+(c) 2020 Network To Code
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+  http://www.apache.org/licenses/LICENSE-2.0
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+import copyreg
+import pickle
+
+from django.test import SimpleTestCase
+
+from netbox_onboarding.utils.credentials import Credentials
+
+
+class LegacyCredentials:
+    """Pickled like the Credentials of the releases without __slots__, restored from their instance __dict__."""
+
+    def __init__(self, **state):
+        """Create the payload with the given instance __dict__."""
+        self.state = state
+
+    def __reduce__(self):
+        """Pickle as a Credentials object created without calling __init__, with a dict state."""
+        return (copyreg._reconstructor, (Credentials, object, None), self.state)  # pylint: disable=protected-access
+
+
+class CredentialsTestCase(SimpleTestCase):
+    """Test the pickling of Credentials, as enqueued with the onboarding jobs."""
+
+    def assertCredentials(self, credentials, username, password, secret):  # pylint: disable=invalid-name
+        """Verify the attributes of a Credentials object."""
+        self.assertIsInstance(credentials, Credentials)
+        self.assertEqual(credentials.username, username)
+        self.assertEqual(credentials.password, password)
+        self.assertEqual(credentials.secret, secret)
+
+    def test_pickle_round_trip(self):
+        """Verify that Credentials are restored from their pickle."""
+        credentials = pickle.loads(pickle.dumps(Credentials("admin", "password", "secret")))
+        self.assertCredentials(credentials, "admin", "password", "secret")
+
+    def test_unpickle_dict_state(self):
+        """Verify that Credentials pickled with a dict state by older releases are restored."""
+        payload = pickle.dumps(LegacyCredentials(username="admin", password="password", secret="secret"))
+
+        credentials = pickle.loads(payload)
+        self.assertCredentials(credentials, "admin", "password", "secret")
+
+    def test_repr_hidden(self):
+        """Verify that the representation of Credentials does not disclose them."""
+        self.assertEqual(repr(Credentials("admin", "password", "secret")), "*Credentials argument hidden*")
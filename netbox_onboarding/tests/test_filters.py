@@ -0,0 +1,91 @@
+"""Unit tests for netbox_onboarding OnboardingTask filters.
+
+(c) 2020 Network To Code
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+  http://www.apache.org/licenses/LICENSE-2.0
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+from unittest import mock
+
+from django.test import TestCase
+
+from dcim.models import Site
+
+from netbox_onboarding.filters import OnboardingTaskFilter
+from netbox_onboarding.models import OnboardingTask
+
+
+class OnboardingTaskFilterTestCase(TestCase):
+    """Test the OnboardingTaskFilter."""
+
+    def setUp(self):
+        """Create the OnboardingTasks to filter."""
+        self.site1 = Site.objects.create(name="USWEST", slug="uswest")
+        self.site2 = Site.objects.create(name="USEAST", slug="useast")
+
+        self.task1 = OnboardingTask.objects.create(ip_address="10.10.10.10", site=self.site1)
+        self.task2 = OnboardingTask.objects.create(ip_address="10.10.10.100", site=self.site1)
+        self.task3 = OnboardingTask.objects.create(ip_address="192.168.1.1", site=self.site2, message="timed out")
+
+        self.queryset = OnboardingTask.objects.all()
+
+    def filter(self, **data):
+        """Return the tasks selected by the filter for the given data."""
+        return set(OnboardingTaskFilter(data, self.queryset).qs)
+
+    def test_search_ip_address(self):
+        """Verify that a complete IP address only matches the tasks for this exact address."""
+        self.assertEqual(self.filter(q="10.10.10.10"), {self.task1})
+
+    def test_search_partial_ip_address(self):
+        """Verify that a partial IP address matches the tasks whose address contains it."""
+        self.assertEqual(self.filter(q="10.10.10"), {self.task1, self.task2})
+
+    def test_search_site_name(self):
+        """Verify that a substring of a site name matches the tasks of this site."""
+        self.assertEqual(self.filter(q="west"), {self.task1, self.task2})
+
+    def test_search_message(self):
+        """Verify that a substring of the message matches the task."""
+        self.assertEqual(self.filter(q="TIMED"), {self.task3})
+
+    def test_search_id(self):
+        """Verify that a number matches the task with this ID."""
+        self.assertIn(self.task3, self.filter(q=str(self.task3.pk)))
+
+    def test_search_large_number(self):
+        """Verify that a number too large to be an ID is not matched against the task IDs."""
+        self.assertEqual(self.filter(q="12345678901"), set())
+
+    def test_search_whitespace(self):
+        """Verify that the search value is stripped, and that whitespace alone does not filter."""
+        self.assertEqual(self.filter(q="  west  "), {self.task1, self.task2})
+        self.assertEqual(self.filter(q="   "), {self.task1, self.task2, self.task3})
+
+    def test_search_empty(self):
+        """Verify that an empty search does not filter."""
+        self.assertEqual(self.filter(q=""), {self.task1, self.task2, self.task3})
+        self.assertEqual(self.filter(), {self.task1, self.task2, self.task3})
+
+    def test_filter_falsy_value(self):
+        """Verify that a filter set to a falsy value such as 0 is still applied."""
+        self.assertEqual(self.filter(id=self.task1.pk), {self.task1})
+        self.assertEqual(self.filter(id=0), set())
+
+    def test_no_filter_skips_filter_queryset(self):
+        """Verify that the base queryset is returned as-is when no filter has a value."""
+        with mock.patch.object(OnboardingTaskFilter, "filter_queryset") as filter_queryset:
+            self.assertEqual(self.filter(), {self.task1, self.task2, self.task3})
+            self.assertEqual(self.filter(q="", site=[]), {self.task1, self.task2, self.task3})
+
+        filter_queryset.assert_not_called()
+
+    def test_filter_site(self):
+        """Verify that the queryset is still filtered when a multiple choice filter has a value."""
+        self.assertEqual(self.filter(site=["useast"]), {self.task3})
@@ -0,0 +1,85 @@
+"""Unit tests for netbox_onboarding helpers.
+
+(c) 2020 Network To Code
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+  http://www.apache.org/licenses/LICENSE-2.0
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+from unittest import mock
+
+from django.test import TestCase
+
+from netbox_onboarding.helpers import enqueue_onboard_device_batch
+from netbox_onboarding.utils.credentials import Credentials
+
+
+class PipelineQueue:
+    """RQ queue of a release whose enqueue_call() accepts a Redis pipeline."""
+
+    def __init__(self):
+        """Create a queue recording the jobs enqueued."""
+        self.connection = mock.MagicMock()
+        self.enqueue = mock.MagicMock()
+        self.calls = []
+
+    def enqueue_call(self, func, args=None, pipeline=None):
+        """Record the enqueued job."""
+        self.calls.append((func, args, pipeline))
+
+
+class LegacyQueue(PipelineQueue):
+    """RQ queue of an older release whose enqueue_call() does not accept a Redis pipeline."""
+
+    def enqueue_call(self, func, args=None):  # pylint: disable=arguments-differ
+        """Record the enqueued job."""
+        self.calls.append((func, args, None))
+
+
+class EnqueueOnboardDeviceBatchTestCase(TestCase):
+    """Test the enqueuing of onboarding jobs in batch."""
+
+    def setUp(self):
+        """Create the jobs to enqueue."""
+        self.credentials = Credentials("admin", "password", "secret")
+        self.pending = [(1, self.credentials), (2, self.credentials)]
+
+    def test_enqueue_with_pipeline(self):
+        """Verify that all the jobs are enqueued through a single pipeline when RQ supports it."""
+        queue = PipelineQueue()
+        pipe = queue.connection.pipeline.return_value.__enter__.return_value
+
+        with mock.patch("netbox_onboarding.helpers.get_default_queue", return_value=queue):
+            enqueue_onboard_device_batch(self.pending)
+
+        self.assertEqual(
+            queue.calls,
+            [
+                ("netbox_onboarding.worker.onboard_device", (1, self.credentials), pipe),
+                ("netbox_onboarding.worker.onboard_device", (2, self.credentials), pipe),
+            ],
+        )
+        pipe.execute.assert_called_once_with()
+        queue.enqueue.assert_not_called()
+
+    def test_enqueue_without_pipeline(self):
+        """Verify that the jobs are enqueued one by one when RQ does not support pipelines."""
+        queue = LegacyQueue()
+
+        with mock.patch("netbox_onboarding.helpers.get_default_queue", return_value=queue):
+            enqueue_onboard_device_batch(self.pending)
+
+        self.assertEqual(
+            queue.enqueue.call_args_list,
+            [
+                mock.call("netbox_onboarding.worker.onboard_device", 1, self.credentials),
+                mock.call("netbox_onboarding.worker.onboard_device", 2, self.credentials),
+            ],
+        )
+        self.assertEqual(queue.calls, [])
+        queue.connection.pipeline.assert_not_called()
@@ -95,3 +95,11 @@ class OnboardingDeviceModelTestCase(TestCase):
         """Verify OnboardingDevice last ot."""
         onboarding_device = OnboardingDevice.objects.get(device=self.device)
         self.assertEqual(onboarding_device.last_ot, self.failed_task2)
+
+    def test_with_latest_task(self):
+        """Verify OnboardingDevice details retrieved through with_latest_task."""
+        onboarding_device = OnboardingDevice.objects.filter(device=self.device).with_latest_task().get()
+        self.assertEqual(onboarding_device.last_check_attempt_date, self.failed_task2.created)
+        self.assertEqual(onboarding_device.last_check_successful_date, self.succeeded_task2.created)
+        self.assertEqual(onboarding_device.status, self.failed_task2.status)
+        self.assertEqual(onboarding_device.last_ot, self.failed_task2)
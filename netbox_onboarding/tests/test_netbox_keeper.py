@@ -19,7 +19,7 @@ from ipam.models import IPAddress
 
 # from netbox_onboarding.netbox_keeper import NetdevKeeper
 from netbox_onboarding.exceptions import OnboardException
-from netbox_onboarding.netbox_keeper import NetboxKeeper
+from netbox_onboarding.netbox_keeper import NetboxKeeper, object_match
 
 PLUGIN_SETTINGS = settings.PLUGINS_CONFIG["netbox_onboarding"]
 
@@ -455,3 +455,58 @@ class NetboxKeeperTestCase(TestCase):
             Platform.objects.get(name=PLUGIN_SETTINGS["platform_map"]["cisco_ios"]).name,
             slugify(PLUGIN_SETTINGS["platform_map"]["cisco_ios"]),
         )
+
+
+class ObjectMatchTestCase(TestCase):
+    """Test the object_match function."""
+
+    def setUp(self):
+        """Create the DeviceTypes to search."""
+        self.manufacturer = Manufacturer.objects.create(name="Cisco", slug="cisco")
+        self.by_slug = DeviceType.objects.create(slug="c3850", model="Catalyst", manufacturer=self.manufacturer)
+        self.by_model = DeviceType.objects.create(slug="catalyst-3850", model="C3850", manufacturer=self.manufacturer)
+        self.search_array = [{"slug__iexact": "c3850"}, {"model__iexact": "c3850"}]
+
+    def test_object_match_slug_precedence(self):
+        """Verify that an object matching the first criteria is preferred to one matching a later criteria."""
+        PLUGIN_SETTINGS["object_match_strategy"] = "loose"
+        self.assertEqual(object_match(DeviceType, self.search_array), self.by_slug)
+
+    def test_object_match_loose_fallback(self):
+        """Verify that loose matching falls back to the next criteria when the first one matches nothing."""
+        PLUGIN_SETTINGS["object_match_strategy"] = "loose"
+        self.by_slug.delete()
+        self.assertEqual(object_match(DeviceType, self.search_array), self.by_model)
+
+    def test_object_match_strict(self):
+        """Verify that strict matching only uses the first criteria."""
+        PLUGIN_SETTINGS["object_match_strategy"] = "strict"
+        self.assertEqual(object_match(DeviceType, self.search_array), self.by_slug)
+
+        self.by_slug.delete()
+        with self.assertRaises(DeviceType.DoesNotExist):
+            object_match(DeviceType, self.search_array)
+
+    def test_object_match_no_match(self):
+        """Verify that DoesNotExist is raised when no object matches any criteria."""
+        PLUGIN_SETTINGS["object_match_strategy"] = "loose"
+        with self.assertRaises(DeviceType.DoesNotExist):
+            object_match(DeviceType, [{"slug__iexact": "c9300"}, {"model__iexact": "c9300"}])
+
+    def test_object_match_first_criteria_tie(self):
+        """Verify that MultipleObjectsReturned is raised when the first criteria matches case-insensitive duplicates."""
+        PLUGIN_SETTINGS["object_match_strategy"] = "loose"
+        DeviceType.objects.create(slug="C3850", model="Catalyst C3850", manufacturer=self.manufacturer)
+
+        with self.assertRaises(DeviceType.MultipleObjectsReturned):
+            object_match(DeviceType, self.search_array)
+
+    def test_object_match_loose_criteria_tie(self):
+        """Verify that OnboardException is raised when a later criteria matches case-insensitive duplicates."""
+        PLUGIN_SETTINGS["object_match_strategy"] = "loose"
+        self.by_slug.delete()
+        DeviceType.objects.create(slug="c3850-duplicate", model="c3850", manufacturer=self.manufacturer)
+
+        with self.assertRaises(OnboardException) as exc_info:
+            object_match(DeviceType, self.search_array)
+        self.assertEqual(exc_info.exception.reason, "fail-general")
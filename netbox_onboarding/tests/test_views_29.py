@@ -11,11 +11,18 @@ WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 See the License for the specific language governing permissions and
 limitations under the License.
 """
+from unittest import mock
+
+from django.db import transaction
+from django.test import TransactionTestCase
+
 from dcim.models import Site
 from utilities.testing import ViewTestCases
 
+from netbox_onboarding.forms import OnboardingTaskFeedCSVForm
 from netbox_onboarding.models import OnboardingTask
 from netbox_onboarding.release import NETBOX_RELEASE_CURRENT, NETBOX_RELEASE_29
+from netbox_onboarding.views import OnboardingTaskFeedBulkImportView
 
 
 if NETBOX_RELEASE_CURRENT >= NETBOX_RELEASE_29:
@@ -54,3 +61,43 @@ if NETBOX_RELEASE_CURRENT >= NETBOX_RELEASE_29:
                 "uswest,10.10.10.20",
                 "uswest,10.10.10.30",
             )
+
+    class OnboardingTaskFeedBulkImportTestCase(TransactionTestCase):
+        """Test the onboarding jobs enqueued by the CSV import, which requires the transaction to be committed."""
+
+        def setUp(self):
+            """Create the Site of the imported tasks."""
+            Site.objects.create(name="USWEST", slug="uswest")
+
+        def save_rows(self, *ip_addresses):
+            """Save a CSV row for each IP address as the bulk import view does, within a single transaction."""
+            view = OnboardingTaskFeedBulkImportView()
+
+            with transaction.atomic():
+                for ip_address in ip_addresses:
+                    obj_form = OnboardingTaskFeedCSVForm(data={"site": "uswest", "ip_address": ip_address})
+                    self.assertTrue(obj_form.is_valid(), obj_form.errors)
+                    view._save_obj(obj_form, mock.Mock())  # pylint: disable=protected-access
+
+        @mock.patch("netbox_onboarding.helpers.enqueue_onboard_device_batch")
+        def test_import_committed(self, enqueue_onboard_device_batch):
+            """Verify that the jobs of all the rows are enqueued at once when the import is committed."""
+            self.save_rows("10.10.10.10", "10.10.10.20")
+
+            enqueue_onboard_device_batch.assert_called_once()
+            pending = enqueue_onboard_device_batch.call_args[0][0]
+            self.assertEqual(
+                [task_id for task_id, _ in pending],
+                list(OnboardingTask.objects.order_by("pk").values_list("pk", flat=True)),
+            )
+
+        @mock.patch("netbox_onboarding.helpers.enqueue_onboard_device_batch")
+        def test_import_rolled_back(self, enqueue_onboard_device_batch):
+            """Verify that no job is enqueued when the import is rolled back."""
+            with self.assertRaises(RuntimeError):
+                with transaction.atomic():
+                    self.save_rows("10.10.10.10", "10.10.10.20")
+                    raise RuntimeError("Import failed")
+
+            enqueue_onboard_device_batch.assert_not_called()
+            self.assertFalse(OnboardingTask.objects.exists())
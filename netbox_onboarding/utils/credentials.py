@@ -16,6 +16,8 @@ limitations under the License.
 class Credentials:
     """Class used to hide user's credentials in RQ worker and Django."""
 
+    __slots__ = ("username", "password", "secret")
+
     def __init__(self, username=None, password=None, secret=None):
         """Create a Credentials instance."""
         self.username = username
@@ -25,3 +27,12 @@ class Credentials:
     def __repr__(self):
         """Return string representation of a Credentials object."""
         return "*Credentials argument hidden*"
+
+    def __reduce__(self):
+        """Pickle a Credentials object as its constructor arguments."""
+        return (self.__class__, (self.username, self.password, self.secret))
+
+    def __setstate__(self, state):
+        """Restore a Credentials object pickled with its instance __dict__ (jobs enqueued by older releases)."""
+        for name, value in state.items():
+            setattr(self, name, value)
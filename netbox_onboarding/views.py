@@ -19,6 +19,7 @@ from django.shortcuts import get_object_or_404, render
 from .release import NETBOX_RELEASE_CURRENT, NETBOX_RELEASE_29, NETBOX_RELEASE_210
 from .filters import OnboardingTaskFilter
 from .forms import OnboardingTaskForm, OnboardingTaskFilterForm, OnboardingTaskFeedCSVForm
+from .helpers import enqueue_onboard_device_on_commit
 from .models import OnboardingTask
 from .tables import OnboardingTaskTable, OnboardingTaskFeedBulkTable
 
@@ -114,7 +115,7 @@ class OnboardingTaskView(ReleaseMixinOnboardingTaskView):
 class OnboardingTaskListView(ReleaseMixinOnboardingTaskListView):
     """View for listing all extant OnboardingTasks."""
 
-    queryset = OnboardingTask.objects.all().order_by("-id")
+    queryset = OnboardingTask.objects.for_list().order_by("-id")
     filterset = OnboardingTaskFilter
     filterset_form = OnboardingTaskFilterForm
     table = OnboardingTaskTable
@@ -134,7 +135,7 @@ class OnboardingTaskCreateView(ReleaseMixinOnboardingTaskCreateView):
 class OnboardingTaskBulkDeleteView(ReleaseMixinOnboardingTaskBulkDeleteView):
     """View for deleting one or more OnboardingTasks."""
 
-    queryset = OnboardingTask.objects.filter()  # TODO: can we exclude currently-running tasks?
+    queryset = OnboardingTask.objects.with_related()  # TODO: can we exclude currently-running tasks?
     table = OnboardingTaskTable
     default_return_url = "plugins:netbox_onboarding:onboardingtask_list"
 
@@ -146,3 +147,18 @@ class OnboardingTaskFeedBulkImportView(ReleaseMixinOnboardingTaskFeedBulkImportV
     model_form = OnboardingTaskFeedCSVForm
     table = OnboardingTaskFeedBulkTable
     default_return_url = "plugins:netbox_onboarding:onboardingtask_list"
+    onboarding_batch = None
+
+    def _save_obj(self, obj_form, *args, **kwargs):
+        """Save a CSV row, its onboarding job is enqueued with those of the other rows once the import is committed.
+
+        All the rows are saved within the same transaction: the callback registered for the first row is discarded
+        with the whole batch if the import is rolled back.
+        """
+        if self.onboarding_batch is None:
+            self.onboarding_batch = []
+            enqueue_onboard_device_on_commit(self.onboarding_batch)
+
+        obj_form.onboarding_batch = self.onboarding_batch
+
+        return super()._save_obj(obj_form, *args, **kwargs)